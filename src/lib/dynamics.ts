@@ -10,6 +10,45 @@ export interface ControlGains {
   rho: number;
 }
 
+// The same few expression strings (f, B, and the Jacobian entries) are
+// evaluated at every RK4 stage and every eigenvalue-grid point, and parsing
+// dominates math.evaluate for expressions this short. Each string is compiled
+// once and the compiled form reused; the cache is reset if edits ever grow it
+// past a few hundred entries.
+const compiledExpressions = new Map<string, math.EvalFunction>();
+const MAX_COMPILED = 512;
+
+/** Evaluate an expression string in a scope, compiling it on first use. */
+function evaluateExpression(expression: string, scope: Record<string, number>): number {
+  let fn = compiledExpressions.get(expression);
+  if (!fn) {
+    fn = math.compile(expression);
+    if (compiledExpressions.size >= MAX_COMPILED) compiledExpressions.clear();
+    compiledExpressions.set(expression, fn);
+  }
+  return Number(fn.evaluate(scope));
+}
+
+/** Evaluation failures collected over a sweep or simulation, so a broken
+ *  expression is logged once rather than at every point it is evaluated. */
+export interface FailureLog {
+  count: number;
+}
+
+/** Log a failure: in full the first time, afterwards only counted. Without a
+ *  log (one-off evaluations) every failure is printed. */
+export function recordFailure(failures: FailureLog | undefined, ...details: unknown[]): void {
+  if (!failures || failures.count === 0) console.error(...details);
+  if (failures) failures.count++;
+}
+
+/** One summary line for the failures that were counted but not printed. */
+export function reportFailures(failures: FailureLog, context: string): void {
+  if (failures.count > 1) {
+    console.error(`${context}: ${failures.count} evaluation failures (only the first was logged).`);
+  }
+}
+
 /** Symbolic partial derivative d(expression)/d(variable) as a simplified string. */
 export function getDerivative(expression: string, variable: string): string {
   if (!expression || expression.trim() === '' || expression === '0') return '0';
@@ -60,12 +99,13 @@ export function stateToObject(state: number[], states: Signal[]): Record<string,
 export function evaluateColumn(
   column: MatrixElement[][],
   stateValues: Record<string, number>,
+  failures?: FailureLog,
 ): number[] {
   return column.map((row) => {
     try {
-      return Number(math.evaluate(row[0].expression, stateValues));
+      return evaluateExpression(row[0].expression, stateValues);
     } catch (error) {
-      console.error('Error evaluating expression:', row[0].expression, error);
+      recordFailure(failures, 'Error evaluating expression:', row[0].expression, error);
       return 0;
     }
   });
@@ -76,15 +116,16 @@ export function evaluateJacobianAtPoint(
   jacobian: JacobianElement[][],
   stateValues: Record<string, number>,
   n: number,
+  failures?: FailureLog,
 ): number[][] {
   const result = Array.from({ length: n }, () => Array<number>(n).fill(0));
   for (let i = 0; i < n; i++) {
     for (let j = 0; j < n; j++) {
       const derivative = jacobian[i][j].expression;
       try {
-        result[i][j] = derivative === '0' ? 0 : Number(math.evaluate(derivative, stateValues));
+        result[i][j] = derivative === '0' ? 0 : evaluateExpression(derivative, stateValues);
       } catch {
-        console.error('Error evaluating derivative:', derivative, 'at point:', stateValues);
+        recordFailure(failures, 'Error evaluating derivative:', derivative, 'at point:', stateValues);
         result[i][j] = 0;
       }
     }
@@ -100,11 +141,12 @@ export function controlInput(
   matrixB: MatrixElement[][],
   W: number[][],
   rho: number,
+  failures?: FailureLog,
 ): number {
   if (!W || !rho) return 0;
   try {
     const stateObj = stateToObject(state, states);
-    const B = evaluateColumn(matrixB, stateObj);
+    const B = evaluateColumn(matrixB, stateObj, failures);
 
     // Error relative to the target equilibrium.
     const isCartPole = states.length === 4 && states[2]?.name === 'p';
@@ -119,7 +161,7 @@ export function controlInput(
     const btWinvError = Number(math.multiply(Bt, WinvError)); // scalar dot product
     return Number(-0.5 * rho * btWinvError);
   } catch (error) {
-    console.error('Error calculating control input:', error);
+    recordFailure(failures, 'Error calculating control input:', error);
     return 0;
   }
 }
@@ -131,13 +173,14 @@ export function stateDerivative(
   states: Signal[],
   matrixB: MatrixElement[][],
   control: ControlGains | null,
+  failures?: FailureLog,
 ): number[] {
   const stateObj = stateToObject(state, states);
-  const openLoop = evaluateColumn(fExpressions, stateObj);
+  const openLoop = evaluateColumn(fExpressions, stateObj, failures);
   if (!control) return openLoop;
 
-  const u = controlInput(state, states, matrixB, control.W, control.rho);
-  const B = evaluateColumn(matrixB, stateObj);
+  const u = controlInput(state, states, matrixB, control.W, control.rho, failures);
+  const B = evaluateColumn(matrixB, stateObj, failures);
   return openLoop.map((f, i) => f + B[i] * u);
 }
 
@@ -149,11 +192,12 @@ export function rk4Step(
   states: Signal[],
   matrixB: MatrixElement[][],
   control: ControlGains | null,
+  failures?: FailureLog,
 ): number[] {
-  const k1 = stateDerivative(state, fExpressions, states, matrixB, control);
-  const k2 = stateDerivative(state.map((x, i) => x + (k1[i] * dt) / 2), fExpressions, states, matrixB, control);
-  const k3 = stateDerivative(state.map((x, i) => x + (k2[i] * dt) / 2), fExpressions, states, matrixB, control);
-  const k4 = stateDerivative(state.map((x, i) => x + k3[i] * dt), fExpressions, states, matrixB, control);
+  const k1 = stateDerivative(state, fExpressions, states, matrixB, control, failures);
+  const k2 = stateDerivative(state.map((x, i) => x + (k1[i] * dt) / 2), fExpressions, states, matrixB, control, failures);
+  const k3 = stateDerivative(state.map((x, i) => x + (k2[i] * dt) / 2), fExpressions, states, matrixB, control, failures);
+  const k4 = stateDerivative(state.map((x, i) => x + k3[i] * dt), fExpressions, states, matrixB, control, failures);
   return state.map((x, i) => x + (dt / 6) * (k1[i] + 2 * k2[i] + 2 * k3[i] + k4[i]));
 }
 
@@ -173,17 +217,20 @@ export function simulate({ states, fExpressions, matrixB, duration, sampleTime,
   const dt = sampleTime;
   const numSteps = Math.floor(duration / dt);
 
+  const failures: FailureLog = { count: 0 };
   let current = states.map((s) => s.ic);
-  const u0 = control ? controlInput(current, states, matrixB, control.W, control.rho) : 0;
+  const u0 = control ? controlInput(current, states, matrixB, control.W, control.rho, failures) : 0;
   const points: SimulationPoint[] = [{ t: 0, states: [...current], u: u0 }];
 
   for (let step = 1; step <= numSteps; step++) {
-    current = rk4Step(current, dt, fExpressions, states, matrixB, control);
+    current = rk4Step(current, dt, fExpressions, states, matrixB, control, failures);
     if (current.some((x) => isNaN(x) || !isFinite(x))) {
+      reportFailures(failures, 'Simulation');
       throw new Error('Simulation produced invalid values. The system might be unstable.');
     }
-    const u = control ? controlInput(current, states, matrixB, control.W, control.rho) : 0;
+    const u = control ? controlInput(current, states, matrixB, control.W, control.rho, failures) : 0;
     points.push({ t: step * dt, states: [...current], u });
   }
+  reportFailures(failures, 'Simulation');
   return points;
 }
@@ -3,7 +3,7 @@
 
 import * as math from 'mathjs';
 import type { EigenvalueAnalysis, JacobianElement, Signal } from '../types';
-import { evaluateJacobianAtPoint } from './dynamics';
+import { evaluateJacobianAtPoint, recordFailure, reportFailures, type FailureLog } from './dynamics';
 
 export function analyzeEigenvalues(
   states: Signal[],
@@ -16,6 +16,9 @@ export function analyzeEigenvalues(
   let minImag = Infinity;
   let maxImag = -Infinity;
   let totalPoints = 0;
+  // Only the first failure (a Jacobian entry or an eigs call) is logged in
+  // full; the rest are tallied and reported once after the sweep.
+  const failures: FailureLog = { count: 0 };
 
   // Sample points along each state's range.
   const gridPoints = states.map((state) => {
@@ -34,7 +37,7 @@ export function analyzeEigenvalues(
       });
 
       try {
-        const A = evaluateJacobianAtPoint(jacobian, stateValues, n);
+        const A = evaluateJacobianAtPoint(jacobian, stateValues, n, failures);
         const result = math.eigs(A);
         if (result && Array.isArray(result.values)) {
           result.values.forEach((value: unknown) => {
@@ -61,7 +64,7 @@ export function analyzeEigenvalues(
         }
         totalPoints++;
       } catch (error) {
-        console.error('Error in eigenvalue analysis at point:', stateValues, error);
+        recordFailure(failures, 'Error in eigenvalue analysis at point:', stateValues, error);
       }
       return;
     }
@@ -73,6 +76,7 @@ export function analyzeEigenvalues(
   };
 
   visit(new Array(n).fill(0), 0);
+  reportFailures(failures, 'Eigenvalue analysis');
 
   return {
     minRealEig: minReal === Infinity ? 0 : minReal,
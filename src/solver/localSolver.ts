@@ -1,20 +1,89 @@
 // Thin async wrapper around the pure-TypeScript SDP solver, exposing the same
 // interface the app used for the old backend call (solveLMI / isReady), so the
-// solve happens locally and instantly with no network or WebAssembly.
+// solve happens locally with no network or WebAssembly. Solves run on a
+// persistent Web Worker (solverWorker.ts) so the UI stays responsive during a
+// heavier n=4 solve; where workers are unavailable (or the worker has failed)
+// they run inline.
 
 import { solveCCM, type CCMPayload, type CCMResult } from './sdpSolver';
+import type { SolveRequest } from './solverWorker';
 
 // The app also sends `state_values` (used only for evaluating A/B on the JS
 // side, already done before this call); the solver itself ignores it.
 export type LMIPayload = CCMPayload & { state_values?: Record<string, number> };
 
+interface Pending {
+  payload: CCMPayload;
+  resolve: (result: CCMResult) => void;
+  reject: (error: unknown) => void;
+}
+
+let worker: Worker | null = null;
+let workerFailed = false;
+let nextId = 0;
+const pending = new Map<number, Pending>();
+
+// Give up on the worker for the rest of the page: solves still in flight are
+// rerun inline, and every later call solves inline too.
+function abandonWorker(): void {
+  workerFailed = true;
+  worker?.terminate();
+  worker = null;
+  const inFlight = [...pending.values()];
+  pending.clear();
+  for (const p of inFlight) {
+    try {
+      p.resolve(solveCCM(p.payload));
+    } catch (error) {
+      p.reject(error);
+    }
+  }
+}
+
+// Create the worker on first use and reuse it for every later solve.
+function getWorker(): Worker | null {
+  if (typeof Worker === 'undefined' || workerFailed) return null;
+  if (!worker) {
+    try {
+      worker = new Worker(new URL('./solverWorker.ts', import.meta.url), { type: 'module' });
+    } catch (error) {
+      console.error('LMI solver worker could not start; solving inline instead:', error);
+      workerFailed = true;
+      return null;
+    }
+    worker.onmessage = (event: MessageEvent<{ id: number; result: CCMResult }>) => {
+      const { id, result } = event.data;
+      pending.get(id)?.resolve(result);
+      pending.delete(id);
+    };
+    worker.onerror = (event) => {
+      console.error('LMI solver worker failed; solving inline instead:', event.message);
+      abandonWorker();
+    };
+    worker.onmessageerror = () => {
+      console.error('LMI solver worker reply could not be read; solving inline instead');
+      abandonWorker();
+    };
+  }
+  return worker;
+}
+
 // Always ready — there is nothing to download or boot.
 export function isReady(): boolean {
   return true;
 }
 
 export async function solveLMI<T = CCMResult>(payload: LMIPayload): Promise<T> {
-  // Yield once so React can paint a "solving" state before a heavier n=4 solve.
-  await Promise.resolve();
-  return solveCCM(payload) as T;
+  const w = getWorker();
+  if (!w) {
+    // Yield once so React can paint a "solving" state before solving inline.
+    await Promise.resolve();
+    return solveCCM(payload) as T;
+  }
+  const id = nextId++;
+  return new Promise<T>((resolve, reject) => {
+    pending.set(id, { payload, resolve: (result) => resolve(result as T), reject });
+    const request: SolveRequest = { id, payload };
+    w.postMessage(request);
+  });
 }
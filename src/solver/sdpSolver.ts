@@ -6,18 +6,21 @@
 //   D variant:  D = [[-WAᵀ-AW+rho BBᵀ, W Lᵀ], [L W, I]]  ⪰ -εI   (L Lᵀ = Q)
 //   box:        αmin I ⪯ W ⪯ αmax I
 //
-// Method: bisection on rho (the feasible-rho set is a half-line [rho*, ∞),
-// because increasing rho only adds rho·BBᵀ ⪰ 0 to the relevant block and so can
-// only relax the constraints). At each fixed rho we solve a *max-margin*
+// Method: a bracketing search on rho (the feasible-rho set is a half-line
+// [rho*, ∞), because increasing rho only adds rho·BBᵀ ⪰ 0 to the relevant block
+// and so can only relax the constraints), refined by safeguarded regula falsi
+// on the margin t*(rho). At each fixed rho we solve a *max-margin*
 // feasibility SDP — maximize t s.t. Gₖ(W) ⪰ tI — with a log-det barrier /
 // Newton interior-point method. That auxiliary problem is always strictly
 // feasible for sufficiently negative t, so no Phase-I is needed, and the sign
 // of the optimal margin t* decides feasibility at that rho.
 //
-// All matrices are plain number[][]; dimensions are tiny (W is n×n with n ≤ 4,
-// the D-block is ≤ 8×8), so dense linear algebra is more than fast enough.
+// All matrices are plain number[][] (the constant constraint coefficients are
+// kept sparse); dimensions are tiny (W is n×n with n ≤ 4, the D-block is
+// ≤ 8×8), so dense linear algebra is more than fast enough.
 
 const EPS = 1e-8; // matches the backend's strict-inequality margin
+const PROBE_GAP = 0.1; // rho probes stop once t* − t ≤ PROBE_GAP·|t − decideAt|
 
 type Mat = number[][];
 
@@ -27,9 +30,18 @@ type Mat = number[][];
 function zeros(r: number, c: number): Mat {
   return Array.from({ length: r }, () => new Array<number>(c).fill(0));
 }
+// Identities are requested for the same few sizes over and over, so one is
+// built per n and shared. It is frozen: an accidental in-place write throws.
+const eyeCache = new Map<number, Mat>();
 function eye(n: number): Mat {
-  const m = zeros(n, n);
-  for (let i = 0; i < n; i++) m[i][i] = 1;
+  let m = eyeCache.get(n);
+  if (!m) {
+    m = zeros(n, n);
+    for (let i = 0; i < n; i++) m[i][i] = 1;
+    m.forEach((row) => Object.freeze(row));
+    Object.freeze(m);
+    eyeCache.set(n, m);
+  }
   return m;
 }
 function clone(a: Mat): Mat {
@@ -62,9 +74,35 @@ function sub(a: Mat, b: Mat): Mat {
 function scale(a: Mat, s: number): Mat {
   return a.map((row) => row.map((v) => v * s));
 }
-function symmetrize(a: Mat): Mat {
-  const n = a.length, out = zeros(n, n);
-  for (let i = 0; i < n; i++) for (let j = 0; j < n; j++) out[i][j] = 0.5 * (a[i][j] + a[j][i]);
+// Gram matrix B Bᵀ (syrk-style): only the lower triangle is computed, then
+// mirrored, so the result is exactly symmetric at half the flops of matmul.
+function gram(b: Mat): Mat {
+  const r = b.length, out = zeros(r, r);
+  for (let i = 0; i < r; i++) {
+    const bi = b[i];
+    for (let j = 0; j <= i; j++) {
+      const bj = b[j];
+      let s = 0;
+      for (let k = 0; k < bi.length; k++) s += bi[k] * bj[k];
+      out[i][j] = s;
+      out[j][i] = s;
+    }
+  }
+  return out;
+}
+// Assemble the 2n×2n block matrix [[tl, tr], [bl, br]] from n×n blocks in one
+// pass; a null block is zero.
+function blocks2n(n: number, tl: Mat | null, tr: Mat | null, bl: Mat | null, br: Mat | null): Mat {
+  const out = zeros(2 * n, 2 * n);
+  for (let i = 0; i < n; i++) {
+    const top = out[i], bottom = out[n + i];
+    for (let j = 0; j < n; j++) {
+      if (tl) top[j] = tl[i][j];
+      if (tr) top[n + j] = tr[i][j];
+      if (bl) bottom[j] = bl[i][j];
+      if (br) bottom[n + j] = br[i][j];
+    }
+  }
   return out;
 }
 // trace(A·B) without forming the product
@@ -102,33 +140,9 @@ function logdetFromChol(L: Mat): number {
   for (let i = 0; i < L.length; i++) s += Math.log(L[i][i]);
   return 2 * s;
 }
-// Inverse of an SPD matrix given its Cholesky factor.
-function invFromChol(L: Mat): Mat {
+// Solve L Lᵀ x = b by forward then backward substitution.
+function cholSolve(L: Mat, b: number[]): number[] {
   const n = L.length;
-  const inv = zeros(n, n);
-  // Solve L Lᵀ X = I column by column.
-  for (let col = 0; col < n; col++) {
-    const y = new Array<number>(n).fill(0);
-    // forward: L y = e_col
-    for (let i = 0; i < n; i++) {
-      let s = i === col ? 1 : 0;
-      for (let k = 0; k < i; k++) s -= L[i][k] * y[k];
-      y[i] = s / L[i][i];
-    }
-    // backward: Lᵀ x = y
-    for (let i = n - 1; i >= 0; i--) {
-      let s = y[i];
-      for (let k = i + 1; k < n; k++) s -= L[k][i] * inv[k][col];
-      inv[i][col] = s / L[i][i];
-    }
-  }
-  return inv;
-}
-// Solve SPD system Hess·x = b (used for the Newton step).
-function solveSPD(H: Mat, b: number[]): number[] | null {
-  const L = cholesky(H);
-  if (!L) return null;
-  const n = H.length;
   const y = new Array<number>(n).fill(0);
   for (let i = 0; i < n; i++) {
     let s = b[i];
@@ -143,12 +157,33 @@ function solveSPD(H: Mat, b: number[]): number[] | null {
   }
   return x;
 }
+// Inverse of an SPD matrix given its Cholesky factor: solve L Lᵀ X = I column
+// by column.
+function invFromChol(L: Mat): Mat {
+  const n = L.length;
+  const inv = zeros(n, n);
+  const e = new Array<number>(n).fill(0);
+  for (let col = 0; col < n; col++) {
+    e[col] = 1;
+    const x = cholSolve(L, e);
+    e[col] = 0;
+    for (let i = 0; i < n; i++) inv[i][col] = x[i];
+  }
+  return inv;
+}
+// Solve SPD system Hess·x = b (used for the Newton step).
+function solveSPD(H: Mat, b: number[]): number[] | null {
+  const L = cholesky(H);
+  return L ? cholSolve(L, b) : null;
+}
 
 // ---------------------------------------------------------------------------
-// Symmetric eigenvalues via cyclic Jacobi (for reporting min/max eigenvalues,
-// matching the backend's eigenvalue ranges). Robust for the small dims here.
+// Symmetric eigenvalue range via cyclic Jacobi (for reporting min/max
+// eigenvalues, matching the backend's eigenvalue ranges). Robust for the small
+// dims here. Every caller needs only the extremes, so [λmin, λmax] is read off
+// the diagonal directly instead of sorting the whole spectrum.
 // ---------------------------------------------------------------------------
-function eigSym(Min: Mat): number[] {
+function eigRange(Min: Mat): [number, number] {
   const n = Min.length;
   const a = clone(Min);
   for (let sweep = 0; sweep < 100; sweep++) {
@@ -175,17 +210,67 @@ function eigSym(Min: Mat): number[] {
       }
     }
   }
-  return Array.from({ length: n }, (_, i) => a[i][i]).sort((x, y) => x - y);
+  let lo = Infinity, hi = -Infinity;
+  for (let i = 0; i < n; i++) {
+    lo = Math.min(lo, a[i][i]);
+    hi = Math.max(hi, a[i][i]);
+  }
+  return [lo, hi];
+}
+// Gershgorin bracket on λmin of a symmetric matrix in O(n²):
+// min_i (aᵢᵢ - Σⱼ≠ᵢ |aᵢⱼ|) ≤ λmin ≤ min_i aᵢᵢ. When both ends coincide (e.g. a
+// diagonal matrix) λmin is known exactly without an eigendecomposition.
+function gershgorinMin(a: Mat): [number, number] {
+  let lo = Infinity, hi = Infinity;
+  for (let i = 0; i < a.length; i++) {
+    let r = 0;
+    for (let j = 0; j < a.length; j++) if (j !== i) r += Math.abs(a[i][j]);
+    lo = Math.min(lo, a[i][i] - r);
+    hi = Math.min(hi, a[i][i]);
+  }
+  return [lo, hi];
 }
 
 // ---------------------------------------------------------------------------
 // Affine matrix constraint:  Gₖ(W) = base + Σᵥ Wᵥ · gcoef[v]  (Wᵥ are the
 // upper-triangle entries of W). In the margin problem we use Hₖ = Gₖ(W) - tI.
+// The coefficients are very sparse — Wᵥ only touches two rows/columns, and A
+// itself is often sparse (chained integrators, the cart-pole) — so they are
+// stored as nonzero entries and every product with them costs O(nnz).
 // ---------------------------------------------------------------------------
+interface SparseMat { // nonzero entries in row-major order
+  rows: Int32Array;
+  cols: Int32Array;
+  vals: Float64Array;
+}
+
 interface Constraint {
   dim: number;
-  base: Mat;       // value at W = 0
-  gcoef: Mat[];    // ∂Gₖ/∂Wᵥ for each W variable
+  base: Mat;           // value at W = 0
+  gcoef: SparseMat[];  // ∂Gₖ/∂Wᵥ for each W variable
+}
+
+function sparsify(a: Mat): SparseMat {
+  const rows: number[] = [], cols: number[] = [], vals: number[] = [];
+  for (let i = 0; i < a.length; i++) {
+    for (let j = 0; j < a[i].length; j++) {
+      if (a[i][j] === 0) continue;
+      rows.push(i);
+      cols.push(j);
+      vals.push(a[i][j]);
+    }
+  }
+  return { rows: Int32Array.from(rows), cols: Int32Array.from(cols), vals: Float64Array.from(vals) };
+}
+// out = a·b for dense a and sparse b, into a preallocated out
+function matmulSparseInto(out: Mat, a: Mat, b: SparseMat): Mat {
+  const { rows, cols, vals } = b;
+  for (const row of out) row.fill(0);
+  for (let q = 0; q < vals.length; q++) {
+    const p = rows[q], e = cols[q], v = vals[q];
+    for (let d = 0; d < a.length; d++) out[d][e] += a[d][p] * v;
+  }
+  return out;
 }
 
 // upper-triangle (r,c) index list for a symmetric n×n W
@@ -209,57 +294,67 @@ interface BuiltProblem {
   buildConstraints: (rho: number) => Constraint[];
 }
 
+// The W-basis depends only on n, so it is built once per dimension and shared
+// across problems (E matrices are never mutated).
+const basisCache = new Map<number, { tri: Array<[number, number]>; E: Mat[] }>();
+function symBasis(n: number): { tri: Array<[number, number]>; E: Mat[] } {
+  let b = basisCache.get(n);
+  if (!b) {
+    const tri = triIndices(n);
+    b = { tri, E: tri.map(([r, c]) => unitSym(n, r, c)) };
+    basisCache.set(n, b);
+  }
+  return b;
+}
+
 function buildProblem(
   A: Mat, B: Mat, L: Mat, alphaMin: number, alphaMax: number,
   lambda: number, n: number, useD: boolean,
 ): BuiltProblem {
-  const tri = triIndices(n);
+  const { tri, E } = symBasis(n);
   const nW = tri.length;
-  const E = tri.map(([r, c]) => unitSym(n, r, c));
   const At = transpose(A);
   const Lt = transpose(L);
-  const BBt = matmul(B, transpose(B));
-
-  // place an n×n block into a 2n×2n matrix at (br,bc) block position
-  const place2n = (block: Mat, br: number, bc: number): Mat => {
-    const out = zeros(2 * n, 2 * n);
-    for (let i = 0; i < n; i++) for (let j = 0; j < n; j++) out[br * n + i][bc * n + j] = block[i][j];
-    return out;
-  };
-
-  const buildConstraints = (rho: number): Constraint[] => {
-    const cons: Constraint[] = [];
-
-    // C1: W - αmin I ⪰ 0
-    cons.push({ dim: n, base: scale(eye(n), -alphaMin), gcoef: E.map((Ev) => clone(Ev)) });
-    // C2: αmax I - W ⪰ 0
-    cons.push({ dim: n, base: scale(eye(n), alphaMax), gcoef: E.map((Ev) => scale(Ev, -1)) });
+  const BBt = gram(B);
+
+  // Only the constant terms depend on rho; the W-coefficients are built once
+  // here and shared by every buildConstraints(rho) call of the rho search.
+  const epsI = scale(eye(n), EPS);
+  // C1: W - αmin I ⪰ 0
+  const c1 = { dim: n, base: scale(eye(n), -alphaMin), gcoef: E.map(sparsify) };
+  // C2: αmax I - W ⪰ 0
+  const c2 = { dim: n, base: scale(eye(n), alphaMax), gcoef: E.map((Ev) => sparsify(scale(Ev, -1))) };
+
+  let c3Dim: number;
+  let c3Coef: SparseMat[];
+  let c3Base: (rho: number) => Mat;
+  if (!useD) {
+    // C3 (H): -(A W + W Aᵀ + 2λ W) + rho BBᵀ - εI ⪰ 0
+    c3Dim = n;
+    c3Coef = E.map((Ev) =>
+      sparsify(scale(add(add(matmul(A, Ev), matmul(Ev, At)), scale(Ev, 2 * lambda)), -1)),
+    );
+    c3Base = (rho) => sub(scale(BBt, rho), epsI);
+  } else {
+    // C3 (D): D(W) + εI ⪰ 0, dim 2n
+    c3Dim = 2 * n;
+    c3Coef = E.map((Ev) => {
+      const tl = scale(add(matmul(Ev, At), matmul(A, Ev)), -1); // -WAᵀ-AW part
+      const tr = matmul(Ev, Lt);                                // W Lᵀ
+      return sparsify(blocks2n(n, tl, tr, transpose(tr), null)); // L W = (W Lᵀ)ᵀ
+    });
+    // base (W=0): [[rho BBᵀ, 0],[0, I]] + εI. The constant I block never
+    // enters the W-coefficients, which only populate the off-diagonal and
+    // top-left blocks.
+    const br = add(eye(n), epsI);
+    c3Base = (rho) => blocks2n(n, add(scale(BBt, rho), epsI), null, null, br);
+  }
 
-    if (!useD) {
-      // C3 (H): -(A W + W Aᵀ + 2λ W) + rho BBᵀ - εI ⪰ 0
-      const base = sub(scale(BBt, rho), scale(eye(n), EPS));
-      const gcoef = E.map((Ev) =>
-        scale(add(add(matmul(A, Ev), matmul(Ev, At)), scale(Ev, 2 * lambda)), -1),
-      );
-      cons.push({ dim: n, base, gcoef });
-    } else {
-      // C3 (D): D(W) + εI ⪰ 0, dim 2n
-      // base (W=0): [[rho BBᵀ, 0],[0, I]] + εI
-      let base = add(place2n(scale(BBt, rho), 0, 0), place2n(eye(n), 1, 1));
-      base = add(base, scale(eye(2 * n), EPS));
-      const gcoef = E.map((Ev) => {
-        const tl = scale(add(matmul(Ev, At), matmul(A, Ev)), -1); // -WAᵀ-AW part
-        const tr = matmul(Ev, Lt);                                // W Lᵀ
-        const bl = matmul(L, Ev);                                 // L W
-        let G = place2n(tl, 0, 0);
-        G = add(G, place2n(tr, 0, 1));
-        G = add(G, place2n(bl, 1, 0));
-        return G;
-      });
-      cons.push({ dim: 2 * n, base, gcoef });
-    }
-    return cons;
-  };
+  const buildConstraints = (rho: number): Constraint[] => [
+    c1,
+    c2,
+    { dim: c3Dim, base: c3Base(rho), gcoef: c3Coef },
+  ];
 
   return { n, nW, tri, buildConstraints };
 }
@@ -272,22 +367,54 @@ function evalH(cons: Constraint[], x: number[], nW: number): Mat[] {
     for (let v = 0; v < nW; v++) {
       const xv = x[v];
       if (xv === 0) continue;
-      const g = con.gcoef[v];
-      for (let i = 0; i < con.dim; i++) for (let j = 0; j < con.dim; j++) H[i][j] += xv * g[i][j];
+      const { rows, cols, vals } = con.gcoef[v];
+      for (let q = 0; q < vals.length; q++) H[rows[q]][cols[q]] += xv * vals[q];
     }
     for (let i = 0; i < con.dim; i++) H[i][i] -= t; // -tI
     return H;
   });
 }
 
+// Newton workspace, overwritten by every step: P_{k,i} = Hₖ⁻¹ · coeff_{k,i},
+// the gradient, and the Hessian. Its shape depends only on the constraint
+// dims, so one per shape is kept at module scope and reused by every
+// max-margin solve — across rho probes and across solveCCM calls, since the
+// solver worker lives as long as the page.
+interface Workspace {
+  Pmats: Mat[][];
+  grad: number[];
+  Hess: Mat;
+}
+const workspaceCache = new Map<string, Workspace>();
+function workspaceFor(cons: Constraint[], nvar: number): Workspace {
+  const key = `${nvar}:${cons.map((con) => con.dim).join(',')}`;
+  let ws = workspaceCache.get(key);
+  if (!ws) {
+    ws = {
+      Pmats: cons.map((con) => Array.from({ length: nvar }, () => zeros(con.dim, con.dim))),
+      grad: new Array<number>(nvar).fill(0),
+      Hess: zeros(nvar, nvar),
+    };
+    workspaceCache.set(key, ws);
+  }
+  return ws;
+}
+
 interface MarginResult {
-  t: number;       // optimal margin t*
+  t: number;       // optimal margin t* (probes: a lower bound, see maxMargin)
   W: Mat;          // a feasible (margin-achieving) W
+  G: Mat[];        // constraint values Gₖ(W) (empty when !ok)
   ok: boolean;     // numerics stayed healthy
 }
 
 // Maximize t s.t. Gₖ(W) ⪰ tI  via a log-det barrier / Newton path-following.
-function maxMargin(P: BuiltProblem, rho: number, alphaMin: number, alphaMax: number): MarginResult {
+// With `decideAt`, only the verdict t* ≥ decideAt is wanted (a rho probe). A
+// centred iterate brackets t ≤ t* ≤ t + mBar/s, so the path is left once that
+// gap is small next to |t − decideAt|: the verdict is then settled and the
+// returned t is a lower bound within PROBE_GAP·|t − decideAt| of t*.
+function maxMargin(
+  P: BuiltProblem, rho: number, alphaMin: number, alphaMax: number, decideAt?: number,
+): MarginResult {
   const cons = P.buildConstraints(rho);
   const nW = P.nW;
   const nvar = nW + 1;
@@ -300,11 +427,18 @@ function maxMargin(P: BuiltProblem, rho: number, alphaMin: number, alphaMax: num
     const idx = P.tri.findIndex(([r, cc]) => r === i && cc === i);
     x[idx] = c;
   }
-  // margins of each Gₖ(W0): Hₖ at t=0
+  // margins of each Gₖ(W0): Hₖ at t=0. The Gershgorin bracket settles most
+  // of them — the box constraints are diagonal at W0 = c·I, and a bracket
+  // lying above the running minimum cannot lower it — so the Jacobi
+  // eigensolver only runs when the bracket is ambiguous.
   x[tIdx] = 0;
   const H0 = evalH(cons, x, nW);
   let minMargin = Infinity;
-  for (const Hk of H0) minMargin = Math.min(minMargin, eigSym(Hk)[0]);
+  for (const Hk of H0) {
+    const [lo, hi] = gershgorinMin(Hk);
+    if (lo >= minMargin) continue;
+    minMargin = Math.min(minMargin, lo === hi ? lo : eigRange(Hk)[0]);
+  }
   x[tIdx] = minMargin - 1.0; // strictly feasible: every Hₖ ≻ 0
 
   // total barrier dimension (for the duality-gap stopping rule)
@@ -319,25 +453,41 @@ function maxMargin(P: BuiltProblem, rho: number, alphaMin: number, alphaMax: num
   let started = false;
   let done = false;
 
+  // Every Hₖ at xx with its Cholesky factor, or null if some Hₖ is not PD. Hₖ
+  // does not depend on s, so the values and factors of an accepted line-search
+  // point are carried into the next Newton step and each iterate is evaluated
+  // and factored once.
+  const factorAt = (xx: number[]): { H: Mat[]; L: Mat[] } | null => {
+    const H = evalH(cons, xx, nW);
+    const L: Mat[] = [];
+    for (const Hk of H) {
+      const Lk = cholesky(Hk);
+      if (!Lk) return null;
+      L.push(Lk);
+    }
+    return { H, L };
+  };
+  // φ_s from the factors: -s·t - Σ logdet Hₖ
+  const phiFrom = (Ls: Mat[], xx: number[]): number =>
+    Ls.reduce((v, L) => v - logdetFromChol(L), -s * xx[tIdx]);
+  let fac = factorAt(x);
+
+  const { Pmats, grad, Hess } = workspaceFor(cons, nvar);
+
   for (let outer = 0; outer < 80 && !done; outer++) {
     // centering: Newton minimize φ_s(x) = -s·t - Σ logdet Hₖ
+    let centered = false;
     for (let nstep = 0; nstep < 50; nstep++) {
-      const H = evalH(cons, x, nW);
-      const chols = H.map(cholesky);
-      if (chols.some((L) => L === null)) { done = true; break; } // reached boundary
+      if (!fac) { done = true; break; } // reached boundary
       started = true;
-      const Hinv = chols.map((L) => invFromChol(L!));
+      const Hinv = fac.L.map(invFromChol);
 
-      // P_{k,i} = Hₖ⁻¹ · coeff_{k,i}
-      const grad = new Array<number>(nvar).fill(0);
-      const Hess = zeros(nvar, nvar);
-      const Pmats: Mat[][] = cons.map(() => new Array<Mat>(nvar));
       for (let k = 0; k < cons.length; k++) {
         const con = cons[k];
-        for (let i = 0; i < nvar; i++) {
-          const coeff = i === tIdx ? scale(eye(con.dim), -1) : con.gcoef[i];
-          Pmats[k][i] = matmul(Hinv[k], coeff);
-        }
+        for (let i = 0; i < nW; i++) matmulSparseInto(Pmats[k][i], Hinv[k], con.gcoef[i]);
+        // the t-coefficient is -I, so P_{k,t} = -Hₖ⁻¹ with no product
+        const Pt = Pmats[k][tIdx], Hk = Hinv[k];
+        for (let d = 0; d < con.dim; d++) for (let e = 0; e < con.dim; e++) Pt[d][e] = -Hk[d][e];
       }
       for (let i = 0; i < nvar; i++) {
         let gi = i === tIdx ? -s : 0;
@@ -370,27 +520,19 @@ function maxMargin(P: BuiltProblem, rho: number, alphaMin: number, alphaMax: num
       // Newton decrement
       let lam2 = 0;
       for (let i = 0; i < nvar; i++) lam2 += -grad[i] * dx[i];
-      if (lam2 / 2 < 1e-12) break;
+      if (lam2 / 2 < 1e-12) { centered = true; break; }
 
       // backtracking line search keeping every Hₖ ≻ 0 and φ decreasing
-      const phi = (xx: number[]): number => {
-        const Hx = evalH(cons, xx, nW);
-        let v = -s * xx[tIdx];
-        for (const Hk of Hx) {
-          const L = cholesky(Hk);
-          if (!L) return Infinity;
-          v -= logdetFromChol(L);
-        }
-        return v;
-      };
-      const phi0 = phi(x);
+      const phi0 = phiFrom(fac.L, x);
       let alpha = 1.0;
       const gdotdx = grad.reduce((acc, g, i) => acc + g * dx[i], 0);
       let stepped = false;
       for (let ls = 0; ls < 40; ls++) {
         const xn = x.map((xi, i) => xi + alpha * dx[i]);
-        if (phi(xn) <= phi0 + 0.25 * alpha * gdotdx) {
+        const cn = factorAt(xn);
+        if (cn && phiFrom(cn.L, xn) <= phi0 + 0.25 * alpha * gdotdx) {
           for (let i = 0; i < nvar; i++) x[i] = xn[i];
+          fac = cn;
           stepped = true;
           break;
         }
@@ -398,6 +540,7 @@ function maxMargin(P: BuiltProblem, rho: number, alphaMin: number, alphaMax: num
       }
       if (!stepped) break; // can't improve; treat as centered
     }
+    if (decideAt !== undefined && centered && mBar / s <= PROBE_GAP * Math.abs(x[tIdx] - decideAt)) break;
     if (mBar / s < 1e-10) break;
     s *= MU;
     if (s > S_MAX) break;
@@ -406,7 +549,10 @@ function maxMargin(P: BuiltProblem, rho: number, alphaMin: number, alphaMax: num
   // recover W from x (x is always the last PD-accepted iterate)
   const W = zeros(P.n, P.n);
   P.tri.forEach(([r, cc], v) => { W[r][cc] = x[v]; W[cc][r] = x[v]; });
-  return { t: x[tIdx], W, ok: started };
+  // Gₖ(W) = Hₖ + tI, reusing the Hₖ already evaluated at that iterate
+  const G = fac ? fac.H : [];
+  for (const Gk of G) for (let i = 0; i < Gk.length; i++) Gk[i][i] += x[tIdx];
+  return { t: x[tIdx], W, G, ok: started };
 }
 
 // ---------------------------------------------------------------------------
@@ -463,17 +609,14 @@ function infeasibleResult(status: string): CCMResult {
   };
 }
 
-// Cholesky-style upper factor L with L Lᵀ = Q (Q diagonal here); falls back to
-// sqrt(diag) when Q is not PD — mirroring the backend.
+// Cholesky-style upper factor L with L Lᵀ = Q. Q is always diagonal here, so
+// the factor is just diag(sqrt(q)) — no factorization needed. Non-positive
+// entries are clamped to 0, matching the backend's sqrt(diag) fallback for a
+// Q that is not PD.
 function choleskyUpperOfDiag(qDiag: number[]): Mat {
   const n = qDiag.length;
   const L = zeros(n, n);
-  let pd = true;
-  for (const q of qDiag) if (q <= 0) pd = false;
   for (let i = 0; i < n; i++) L[i][i] = Math.sqrt(Math.max(qDiag[i], 0));
-  // For a diagonal Q the upper Cholesky factor is just diag(sqrt(q)); the
-  // backend transposes chol(Q) but for diagonal Q that is identical.
-  void pd;
   return L;
 }
 
@@ -483,16 +626,18 @@ export function solveCCM(payload: CCMPayload): CCMResult {
   const t0 = nowMs();
   try {
     const n = payload.n | 0;
-    const A = payload.matrix_a.map((r) => r.slice());
-    const B = payload.matrix_b.map((r) => r.slice());
+    // A and B are only read, never mutated, so the payload rows are used as-is
+    const { matrix_a: A, matrix_b: B } = payload;
     const L = choleskyUpperOfDiag(payload.matrix_q);
     const { alpha_min: alphaMin, alpha_max: alphaMax, lambda_val: lambda, use_d_constraint: useD } = payload;
 
     const P = buildProblem(A, B, L, alphaMin, alphaMax, lambda, n, useD);
     const setupTime = (nowMs() - t0) / 1000;
 
-    const feasibleAt = (rho: number): MarginResult => maxMargin(P, rho, alphaMin, alphaMax);
     const T_FEAS = -1e-7; // margin threshold counted as feasible
+    // Probes only need the verdict; the full max-margin solve is kept for the
+    // final W at rho*.
+    const feasibleAt = (rho: number): MarginResult => maxMargin(P, rho, alphaMin, alphaMax, T_FEAS);
 
     // bracket the minimal feasible rho
     let rhoStar: number;
@@ -500,44 +645,66 @@ export function solveCCM(payload: CCMPayload): CCMResult {
     if (r0.ok && r0.t >= T_FEAS) {
       rhoStar = 0;
     } else {
+      // g(rho) = t*(rho) - T_FEAS at the last infeasible / feasible probes
+      let lo = 0;
+      let gLo = r0.ok ? r0.t - T_FEAS : NaN;
       let hi = 1.0;
       let hiRes = feasibleAt(hi);
       const RHO_CAP = 1e7;
       while ((!hiRes.ok || hiRes.t < T_FEAS) && hi < RHO_CAP) {
+        lo = hi;
+        gLo = hiRes.ok ? hiRes.t - T_FEAS : NaN;
         hi *= 4;
         hiRes = feasibleAt(hi);
       }
       if (!hiRes.ok || hiRes.t < T_FEAS) {
         return infeasibleResult('infeasible');
       }
-      // bisection on [lo, hi], lo infeasible (0), hi feasible
-      let lo = 0;
+      // Refine [lo, hi] reusing the margins already computed. The bracket
+      // itself rests only on the probe verdicts. The probe t values are lower
+      // bounds on t*, off by at most PROBE_GAP·|t − T_FEAS|, so the secant
+      // through them is only approximate; but t*(rho) is nondecreasing and
+      // concave in rho (Gₖ is jointly affine in W and rho), so it still makes
+      // a good next probe. Illinois-style
+      // down-weighting of a stale endpoint keeps both ends moving; fall back to
+      // bisection whenever the secant is unusable.
+      let gHi = hiRes.t - T_FEAS;
+      let lastSide = 0; // +1: hi moved last, -1: lo moved last
       for (let it = 0; it < 60; it++) {
-        const mid = 0.5 * (lo + hi);
+        let mid = Number.isFinite(gLo) && gHi > gLo ? (lo * gHi - hi * gLo) / (gHi - gLo) : NaN;
+        if (!(mid > lo && mid < hi)) mid = 0.5 * (lo + hi);
         const res = feasibleAt(mid);
-        if (res.ok && res.t >= T_FEAS) hi = mid; else lo = mid;
+        if (res.ok && res.t >= T_FEAS) {
+          hi = mid;
+          gHi = res.t - T_FEAS;
+          if (lastSide === 1) gLo *= 0.5;
+          lastSide = 1;
+        } else {
+          lo = mid;
+          gLo = res.ok ? res.t - T_FEAS : NaN;
+          if (lastSide === -1) gHi *= 0.5;
+          lastSide = -1;
+        }
         if (hi - lo < 1e-9 * Math.max(1, hi)) break;
       }
       rhoStar = hi;
     }
 
     // final solve at rho* to recover W
-    const finalRes = feasibleAt(rhoStar);
+    const finalRes = maxMargin(P, rhoStar, alphaMin, alphaMax);
     if (!finalRes.ok) return infeasibleResult('failed');
-    const Wsym = symmetrize(finalRes.W);
+    // maxMargin mirrors W from its upper triangle, so it is exactly symmetric
+    const W = finalRes.W;
 
-    // M = W⁻¹
-    const Lw = cholesky(Wsym);
+    // M = W⁻¹ from the Cholesky factor (W ≻ 0 by the box constraint)
+    const Lw = cholesky(W);
     if (!Lw) return infeasibleResult('failed');
     const M = invFromChol(Lw);
 
     // report eigenvalues / constraint checks exactly like the backend
-    const BBt = matmul(B, transpose(B));
-    const At = transpose(A);
-    const eigW = eigSym(Wsym);
-    const eigM = eigSym(symmetrize(M));
-    const minEigW = eigW[0], maxEigW = eigW[eigW.length - 1];
-    const minEigM = eigM[0], maxEigM = eigM[eigM.length - 1];
+    const [minEigW, maxEigW] = eigRange(W);
+    // eig(W⁻¹) = 1 / eig(W): no second eigendecomposition needed for M
+    const minEigM = 1 / maxEigW, maxEigM = 1 / minEigW;
 
     let minEigH: number | null = null, maxEigH: number | null = null;
     let minEigD: number | null = null, maxEigD: number | null = null;
@@ -545,34 +712,21 @@ export function solveCCM(payload: CCMPayload): CCMResult {
     const tol = 1e-6;
 
     if (!useD) {
-      // H = A W + W Aᵀ - rho BBᵀ + 2λW
-      let H = add(add(matmul(A, Wsym), matmul(Wsym, At)), scale(Wsym, 2 * lambda));
-      H = sub(H, scale(BBt, rhoStar));
-      const eigH = eigSym(symmetrize(H));
-      minEigH = eigH[0]; maxEigH = eigH[eigH.length - 1];
+      // C3 = -H - εI, so eig(H) = -eig(C3) - ε
+      const [gMin, gMax] = eigRange(finalRes.G[2]);
+      minEigH = -gMax - EPS; maxEigH = -gMin - EPS;
       hNegDef = maxEigH <= tol;
     } else {
-      // D = [[-WAᵀ-AW+rho BBᵀ, W Lᵀ],[L W, I]]
-      const Lt = transpose(L);
-      const d11 = add(sub(scale(matmul(Wsym, At), -1), matmul(A, Wsym)), scale(BBt, rhoStar));
-      const d12 = matmul(Wsym, Lt);
-      const d21 = matmul(L, Wsym);
-      const D = zeros(2 * n, 2 * n);
-      for (let i = 0; i < n; i++) for (let j = 0; j < n; j++) {
-        D[i][j] = d11[i][j];
-        D[i][n + j] = d12[i][j];
-        D[n + i][j] = d21[i][j];
-        D[n + i][n + j] = i === j ? 1 : 0;
-      }
-      const eigD = eigSym(symmetrize(D));
-      minEigD = eigD[0]; maxEigD = eigD[eigD.length - 1];
+      // C3 = D + εI, so eig(D) = eig(C3) - ε
+      const [gMin, gMax] = eigRange(finalRes.G[2]);
+      minEigD = gMin - EPS; maxEigD = gMax - EPS;
       dPosDef = minEigD >= -tol;
     }
 
     const solveTime = (nowMs() - t0) / 1000;
     return {
       feasible: true,
-      W: Wsym, M,
+      W, M,
       rho: rhoStar,
       min_eig_h: minEigH, max_eig_h: maxEigH,
       min_eig_d: minEigD, max_eig_d: maxEigD,
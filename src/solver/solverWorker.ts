@@ -0,0 +1,15 @@
+// Dedicated worker hosting the SDP solver, so an LMI solve never blocks the UI
+// thread. localSolver.ts creates it once and keeps it for the page's lifetime
+// unless it fails, after which solves fall back to running inline.
+
+import { solveCCM, type CCMPayload } from './sdpSolver';
+
+export interface SolveRequest {
+  id: number;
+  payload: CCMPayload;
+}
+
+self.onmessage = (event: MessageEvent<SolveRequest>) => {
+  const { id, payload } = event.data;
+  self.postMessage({ id, result: solveCCM(payload) });
+};